@@ -16,6 +16,12 @@ The configurable properties used by PyMzn are the following:
  * **args**: Additional arguments to pass to the template engine;
  * **include**: List of search paths to include in all minizinc calls;
  * **keep**: Overrides the keep flag of all minizinc calls;
+ * **template_cache**: Directory where the template engine caches the compiled
+   templates loaded from the search paths, so that they are not parsed again
+   by later processes; if ``True``, a default temporary directory is used;
+ * **template_reload**: Whether the template engine checks the templates
+   loaded from the search paths for changes at each rendering; by default the
+   templates are loaded only once;
  * **dzn_width**: The horizontal character limit for dzn files;
    This property is used to wrap long dzn statements when writing dzn files.
    This property is also used in the minizinc function as a limit to decide
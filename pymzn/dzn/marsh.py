@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 
-import logging
-
-from .. import config
+from .. import config, logger
 
 from enum import Enum
 from textwrap import TextWrapper
@@ -368,8 +366,6 @@ def dict2dzn(
     list
         List of strings containing the dzn-encoded objects.
     """
-    log = logging.getLogger(__name__)
-
     vals = []
     enums = set()
     for key, val in objs.items():
@@ -386,7 +382,7 @@ def dict2dzn(
         vals.append(stmt)
 
     if fout:
-        log.debug('Writing file: {}'.format(fout))
+        logger.debug('Writing file: %s', fout)
         with open(fout, 'w') as f:
             for val in vals:
                 f.write('{}\n\n'.format(val))
@@ -22,60 +22,60 @@ FloatSet = namedtuple('FloatSet', ['lb', 'ub'])
 _bool_p = re.compile('^(?:true|false)$')
 
 # integer pattern
-_int_p = re.compile('^[+\-]?\d+$')
+_int_p = re.compile(r'^[+\-]?\d+$')
 
 # float pattern
-_float_p = re.compile('^[+\-]?\d*\.\d+(?:[eE][+\-]?\d+)?$')
+_float_p = re.compile(r'^[+\-]?\d*\.\d+(?:[eE][+\-]?\d+)?$')
 
 # ratio pattern (used in OptiMathSat)
-_ratio_p = re.compile('^\s*(?P<numerator>\d+)/(?P<denominator>\d+)$')
+_ratio_p = re.compile(r'^\s*(?P<numerator>\d+)/(?P<denominator>\d+)$')
 
 # enum value pattern
-_enum_val_p = re.compile('^\w+$')
+_enum_val_p = re.compile(r'^\w+$')
 
 # contiguous set
 _cont_set_p = re.compile(
-    '^\(?\s*([+\-]?\s*\d+(?:\.\d+)?)\s*\)?\s*\.\.\s*\(?\s*([+\-]?\s*\d+(?:\.\d+)?)\s*\)?$'
+    r'^\(?\s*([+\-]?\s*\d+(?:\.\d+)?)\s*\)?\s*\.\.\s*\(?\s*([+\-]?\s*\d+(?:\.\d+)?)\s*\)?$'
 )
 
 # set pattern
-_set_p = re.compile('^(\{(?P<vals>[\w\d\s,\.+\-\(\)]*)\})$')
+_set_p = re.compile(r'^(\{(?P<vals>[\w\d\s,\.+\-\(\)]*)\})$')
 
 # contiguous integer set pattern
-_cont_int_set_p = re.compile('^([+\-]?\d+)\.\.([+\-]?\d+)$')
+_cont_int_set_p = re.compile(r'^([+\-]?\d+)\.\.([+\-]?\d+)$')
 
 # enum pattern
-_enum_p = re.compile('^\{(?P<vals>[\w\s,]*)\}$')
+_enum_p = re.compile(r'^\{(?P<vals>[\w\s,]*)\}$')
 
 # matches any of the previous
 _val_p = re.compile(
-    '(?:true|false|[+\-]?\d+|[+\-]?\d*\.\d+(?:[eE][+\-]?\d+)?|\w+'
-    '|\(?\s*[+\-]?\d+(?:\.\d+)?\)?\.\.\(?[+\-]?\d+(?:\.\d+)?\s*\)?'
-    '|\{[\w\d\s,\.+\-\(\)]*\})'
+    r'(?:true|false|[+\-]?\d+|[+\-]?\d*\.\d+(?:[eE][+\-]?\d+)?|\w+'
+    r'|\(?\s*[+\-]?\d+(?:\.\d+)?\)?\.\.\(?[+\-]?\d+(?:\.\d+)?\s*\)?'
+    r'|\{[\w\d\s,\.+\-\(\)]*\})'
 )
 
 # multi-dimensional array pattern
 _array_p = re.compile(
-    '^\s*(?:array(?P<dim>\d)d\s*\(\s*'
-    '(?P<indices>[\w\d\s\.+\-\(\)\{\}]+(?:\s*,\s*[\w\d\s\.+\-\(\)\{\}]+)*)\s*,'
-    '\s*)?\[(?P<vals>[\w\s\.,+\-\\\/\*^|\(\)\{\}]*)\]\)?\s*$'
+    r'^\s*(?:array(?P<dim>\d)d\s*\(\s*'
+    r'(?P<indices>[\w\d\s\.+\-\(\)\{\}]+(?:\s*,\s*[\w\d\s\.+\-\(\)\{\}]+)*)\s*,'
+    r'\s*)?\[(?P<vals>[\w\s\.,+\-\\\/\*^|\(\)\{\}]*)\]\)?\s*$'
 )
 
 # variable pattern
-_var_p = re.compile('^\s*(?P<var>[\w]+)\s*=\s*(?P<val>.+)$', re.DOTALL)
+_var_p = re.compile(r'^\s*(?P<var>[\w]+)\s*=\s*(?P<val>.+)$', re.DOTALL)
 
 # statement pattern
-_stmt_p = re.compile('\s*([^;]+?);')
+_stmt_p = re.compile(r'\s*([^;]+?);')
 
 # comment pattern
 _comm_p = re.compile('%.+?\n')
 
 # set type pattern
-_set_type_p = re.compile('set\s+of\s+(?P<type>\w+)')
+_set_type_p = re.compile(r'set\s+of\s+(?P<type>\w+)')
 
 # array type pattern
 _array_type_p = re.compile(
-    'array\s*\[\s*(?P<indices>\w+(\s*,\s*\w+)*)\s*\]\s+of\s+(?P<type>[\w ]+)'
+    r'array\s*\[\s*(?P<indices>\w+(\s*,\s*\w+)*)\s*\]\s+of\s+(?P<type>[\w ]+)'
 )
 
 
@@ -480,7 +480,7 @@ def _to_var_type(var, var_type):
             var_type['type'] = 'int'
             var_type['enum_type'] = array_type
         return var_type
-    elif re.match('\w+', var_type):
+    elif re.match(r'\w+', var_type):
         return {'type': 'int', 'enum_type': var_type}
     else:
         err = 'Type {} of variable {} not recognized.'
@@ -18,8 +18,8 @@ __all__ = ['minizinc', 'solve']
 
 
 async def _start_minizinc_proc(*args, input=None):
-    args = [config.minizinc] + list(args)
-    logger.debug('Starting minizinc with arguments: {}'.format(args))
+    args = [config.minizinc, *args]
+    logger.debug('Starting minizinc with arguments: %s', args)
     return await start_process(*args, stdin=input)
 
 
@@ -104,6 +104,7 @@ class AsyncSolutionParser(SolutionParser):
         solns.status = self.status
         solns.stderr = proc.stderr_data
         solns.log = self.solver_parser.log
+        solns.stats = self.solver_parser.stats
 
     async def _parse(self, proc):
         parse_lines = self._parse_lines()
@@ -1,11 +1,21 @@
 
+import os
+
 from time import monotonic as _time
 from asyncio.subprocess import create_subprocess_exec, PIPE
 
+from ..process import _resolve_executable
+
 
 __all__ = ['start_process']
 
 
+# As in the synchronous counterpart, keeping close_fds=False and passing the
+# full path of the executable lets subprocess spawn the process with
+# posix_spawn instead of fork + exec.
+_spawn_kwargs = {} if os.name == 'nt' else {'close_fds': False}
+
+
 class ProcessWrapper:
 
     def __init__(self, proc):
@@ -84,7 +94,8 @@ class ProcessWrapper:
 
 
 async def start_process(*args, stdin=PIPE):
+    args = _resolve_executable(args)
     return ProcessWrapper(await create_subprocess_exec(
-        *args, stdin=stdin, stdout=PIPE, stderr=PIPE
+        *args, stdin=stdin, stdout=PIPE, stderr=PIPE, **_spawn_kwargs
     ))
 
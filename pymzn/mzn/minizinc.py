@@ -27,16 +27,22 @@ the solution stream of a solver.
 import os
 import re
 import json
+import hashlib
+import logging
+import threading
 import contextlib
 
 from time import monotonic as _time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 from tempfile import NamedTemporaryFile
 
 from .. import config, dict2dzn, logger
 
 from .rewrap import rewrap_model
 from .solvers import gecode
-from .process import run_process
+from .process import run_process, start_process
 
 from . import output
 from .output import *
@@ -45,15 +51,81 @@ from .output import SolutionParser
 
 __all__ = [
     'minizinc_version', 'preprocess_model', 'save_model', 'check_model',
-    'check_instance', 'minizinc', 'solve', 'mzn2fzn', 'solns2out',
-    'MiniZincError'
+    'check_instance', 'minizinc', 'minizinc_many', 'SolverPool', 'solve',
+    'mzn2fzn', 'solns2out', 'MiniZincError'
 ] + output.__all__
 
 
-def _run_minizinc_proc(*args, input=None):
-    logger.debug('Executing minizinc with arguments: {}'.format(args))
-    args = [config.minizinc] + list(args)
-    return run_process(*args, input=input)
+_OUTPUT_MODES = {'dict', 'item', 'dzn', 'json', 'raw'}
+
+# Output modes that are passed through to the minizinc executable.
+_OUTPUT_MODE_ARGS = {
+    'item': ('--output-mode', 'item'),
+    'dzn': ('--output-mode', 'dzn'),
+    'json': ('--output-mode', 'json')
+}
+
+
+def _run_minizinc_proc(*args, input=None, timeout=None):
+    logger.debug('Executing minizinc with arguments: %s', args)
+    args = [config.minizinc, *args]
+    return run_process(*args, input=input, timeout=timeout)
+
+
+#: Seconds allowed to minizinc beyond the time limit before being terminated.
+_TIMEOUT_GRACE = 5
+
+#: Maximum number of solver outputs kept by the ``solve`` cache.
+_SOLVE_CACHE_SIZE = 64
+
+_solve_cache = OrderedDict()
+_solve_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _file_content_digest(path, mtime_ns, size):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _file_digest(path):
+    # The digest is recomputed only if the modification time or the size of
+    # the file change, so unchanged files are not read again.
+    stat = os.stat(path)
+    return _file_content_digest(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _solve_cache_key(args, mzn, dzn_files, input=None):
+    # The trailing arguments are the model and data files; they are replaced
+    # by the digest of their content, so that temporary files with the same
+    # content produce the same key.
+    files = list(dzn_files)
+    if input is None:
+        files.insert(0, mzn)
+    opts = tuple(args[:len(args) - len(dzn_files) - 1])
+    digests = tuple(_file_digest(f) for f in files)
+    return config.minizinc, opts, digests, input
+
+
+def _cached_solve(key):
+    with _solve_cache_lock:
+        proc = _solve_cache.get(key)
+        if proc is not None:
+            _solve_cache.move_to_end(key)
+        return proc
+
+
+def _cache_solve(key, proc):
+    with _solve_cache_lock:
+        _solve_cache[key] = proc
+        while len(_solve_cache) > _SOLVE_CACHE_SIZE:
+            _solve_cache.popitem(last=False)
+
+
+def _start_minizinc_proc(*args, input=None, timeout=None):
+    logger.debug('Starting minizinc with arguments: %s', args)
+    args = [config.minizinc, *args]
+    return start_process(*args, input=input, timeout=timeout)
 
 
 def _run_minizinc(*args, input=None):
@@ -64,7 +136,7 @@ def _run_minizinc(*args, input=None):
 def minizinc_version():
     """Returns the version of the found minizinc executable."""
     vs = _run_minizinc('--version')
-    m = re.findall('version ([\d\.]+)', vs)
+    m = re.findall(r'version ([\d\.]+)', vs)
     if not m:
         raise RuntimeError('MiniZinc executable not found.')
     return m[0]
@@ -72,7 +144,7 @@ def minizinc_version():
 
 def check_version():
     version = minizinc_version()
-    logger.info('Using MiniZinc {}.'.format(version))
+    logger.info('Using MiniZinc %s.', version)
     major, minor, *_ = version.split('.')
     major, minor = int(major), int(minor)
     vs = major * 100 + minor
@@ -85,39 +157,52 @@ def _process_template(model, **kwargs):
     return from_string(model, kwargs)
 
 
-def _var_types(mzn, allow_multiple_assignments=False):
-    args = ['--model-types-only']
-    if allow_multiple_assignments:
-        args.append('--allow-multiple-assignments')
+def _fspath(path):
+    # Converts path-like objects (e.g. pathlib.Path) to strings, like os.fspath
+    # which is not available on Python 3.5.
+    if hasattr(path, '__fspath__'):
+        return path.__fspath__()
+    return path
 
-    input = None
-    if mzn.endswith('.mzn'):
-        args.append(mzn)
-    else:
-        args.append('-')
-        input = mzn
 
-    json_str = _run_minizinc(*args, input=input)
-    var_types = json.loads(json_str)['var_types']['vars']
-    logger.info('Found var types: {}'.format(var_types))
-    return var_types
+def _model_ext(mzn):
+    return os.path.splitext(mzn)[1]
 
 
-def _model_interface(mzn, allow_multiple_assignments=False):
-    args = ['--model-interface-only']
+def _model_args(mzn, dzn_files=()):
+    # Models and already flattened models are passed by path, anything else is
+    # the content of a model and is passed through the standard input.
+    if _model_ext(mzn) in ('.mzn', '.fzn'):
+        return [mzn, *dzn_files], None
+    return [*dzn_files, '-'], mzn
+
+
+def _model_info(option, mzn, allow_multiple_assignments=False):
+    args = [option]
     if allow_multiple_assignments:
         args.append('--allow-multiple-assignments')
 
-    input = None
-    if mzn.endswith('.mzn'):
-        args.append(mzn)
-    else:
-        args.append('-')
-        input = mzn
+    model_args, input = _model_args(mzn)
+    args += model_args
+
+    return json.loads(_run_minizinc(*args, input=input))
+
 
-    json_str = _run_minizinc(*args, input=input)
-    model_interface = json.loads(json_str)
-    logger.info('Found model interface: {}'.format(model_interface))
+def _var_types(mzn, allow_multiple_assignments=False):
+    var_types = _model_info(
+        '--model-types-only', mzn,
+        allow_multiple_assignments=allow_multiple_assignments
+    )['var_types']['vars']
+    logger.info('Found var types: %s', var_types)
+    return var_types
+
+
+def _model_interface(mzn, allow_multiple_assignments=False):
+    model_interface = _model_info(
+        '--model-interface-only', mzn,
+        allow_multiple_assignments=allow_multiple_assignments
+    )
+    logger.info('Found model interface: %s', model_interface)
     return model_interface
 
 
@@ -174,14 +259,13 @@ def _process_output_vars(
         output_vars = [k for k in model_int['output']]
     output_stmt = _dzn_output_statement(output_vars, types)
     output_stmt_p_str = \
-        'output\s*\[(\".+?\"|[^\"]+?)+\](\s*\+\+\s*\[(\".+?\"|[^\"]+?)+\])*\s*(?:;)?'
+        r'output\s*\[(\".+?\"|[^\"]+?)+\](\s*\+\+\s*\[(\".+?\"|[^\"]+?)+\])*\s*(?:;)?'
     output_stmt_p = re.compile(output_stmt_p_str, re.DOTALL)
     if output_stmt_p.search(model):
-        logger.info(
-            'Substituting model output statement: {}'.format(output_stmt))
+        logger.info('Substituting model output statement: %s', output_stmt)
         output_stmt = output_stmt.replace('\\', '\\\\')
         return output_stmt_p.sub(output_stmt, model)
-    logger.info('Adding model output statement: {}'.format(output_stmt))
+    logger.info('Adding model output statement: %s', output_stmt)
     return '\n'.join([model, output_stmt])
 
 
@@ -254,7 +338,7 @@ def save_model(model, output_file=None, output_dir=None, output_prefix='pymzn'):
     output_file.write(model)
     output_file.close()
 
-    logger.info('Generated file: {}'.format(mzn_file))
+    logger.info('Generated file: %s', mzn_file)
     return mzn_file
 
 
@@ -263,7 +347,7 @@ def _cleanup(files):
         for _file in files:
             if _file:
                 os.remove(_file)
-                logger.info('Deleted file: {}'.format(_file))
+                logger.info('Deleted file: %s', _file)
 
 
 def _prepare_data(mzn_file, data, keep_data=False, declare_enums=True):
@@ -282,7 +366,7 @@ def _prepare_data(mzn_file, data, keep_data=False, declare_enums=True):
         data_file = mzn_base + '_data.dzn'
         with open(data_file, 'w') as f:
             f.write('\n'.join(data))
-        logger.debug('Generated file: {}'.format(data_file))
+        logger.debug('Generated file: %s', data_file)
         data = None
     else:
         data = ' '.join(data)
@@ -290,10 +374,15 @@ def _prepare_data(mzn_file, data, keep_data=False, declare_enums=True):
     return data, data_file
 
 
-def _flattening_args(
-    mzn, *dzn_files, data=None, stdlib_dir=None, globals_dir=None,
-    output_mode='dict', include=None, no_ozn=False, output_base=None,
-    allow_multiple_assignments=False
+@lru_cache(maxsize=64)
+def _include_args(include):
+    return tuple(arg for path in include for arg in ('-I', path))
+
+
+@lru_cache(maxsize=128)
+def _flattening_opts(
+    stdlib_dir=None, globals_dir=None, output_mode='dict', no_ozn=False,
+    output_base=None, allow_multiple_assignments=False
 ):
     args = []
 
@@ -301,8 +390,7 @@ def _flattening_args(
         args += ['--stdlib_dir', stdlib_dir]
     if globals_dir:
         args += ['-G', globals_dir]
-    if output_mode and output_mode in ['dzn', 'json', 'item']:
-        args += ['--output-mode', output_mode]
+    args += _OUTPUT_MODE_ARGS.get(output_mode, ())
     if no_ozn:
         args.append('--no-output-ozn')
     if output_base:
@@ -310,26 +398,37 @@ def _flattening_args(
     if allow_multiple_assignments:
         args.append('--allow-multiple-assignments')
 
-    if include:
-        if isinstance(include, str):
-            include = [include]
-        elif not isinstance(include, list):
-            raise TypeError('The include path is not valid.')
+    return tuple(args)
+
+
+def _flattening_args(
+    mzn, *dzn_files, data=None, stdlib_dir=None, globals_dir=None,
+    output_mode='dict', include=None, no_ozn=False, output_base=None,
+    allow_multiple_assignments=False
+):
+    args = list(_flattening_opts(
+        stdlib_dir=stdlib_dir, globals_dir=globals_dir,
+        output_mode=output_mode, no_ozn=no_ozn, output_base=output_base,
+        allow_multiple_assignments=allow_multiple_assignments
+    ))
+
+    if not include:
+        include = ()
+    elif isinstance(include, str) or hasattr(include, '__fspath__'):
+        include = (_fspath(include),)
+    elif isinstance(include, (list, tuple)):
+        include = tuple(_fspath(path) for path in include)
     else:
-        include = []
+        raise TypeError('The include path is not valid.')
 
-    include += config.get('include', [])
-    for path in include:
-        args += ['-I', path]
+    include += tuple(config.get('include', ()))
+    args += _include_args(include)
 
     if data:
         args += ['-D', data]
 
-    if mzn.endswith('.mzn'):
-        args += [mzn] + list(dzn_files)
-    else:
-        args += list(dzn_files) + ['-']
-
+    dzn_files = [_fspath(dzn_file) for dzn_file in dzn_files]
+    args += _model_args(_fspath(mzn), dzn_files)[0]
     return args
 
 
@@ -437,18 +536,23 @@ def _minizinc_preliminaries(
     globals_dir=None, output_vars=None, keep=False, output_base=None,
     output_mode='dict', declare_enums=True, allow_multiple_assignments=False
 ):
-    logger.info('Starting preliminaries, received arguments: {}'.format({
-        'include': include, 'stdlib_dir': stdlib_dir,
-        'globals_dir': globals_dir, 'output_vars': output_vars, 'keep': keep,
-        'output_base': output_base, 'output_mode': output_mode,
-        'declare_enums': declare_enums,
-        'allow_multiple_assignments': allow_multiple_assignments
-    }))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Starting preliminaries, received arguments: %s', {
+            'include': include, 'stdlib_dir': stdlib_dir,
+            'globals_dir': globals_dir, 'output_vars': output_vars,
+            'keep': keep, 'output_base': output_base,
+            'output_mode': output_mode, 'declare_enums': declare_enums,
+            'allow_multiple_assignments': allow_multiple_assignments
+        })
+
+    if output_mode not in _OUTPUT_MODES:
+        raise ValueError('Unrecognized output mode: {}'.format(output_mode))
 
     check_version()
 
+    mzn = _fspath(mzn)
     if mzn and isinstance(mzn, str):
-        if mzn.endswith('mzn'):
+        if _model_ext(mzn) == '.mzn':
             if os.path.isfile(mzn):
                 mzn_file = mzn
                 with open(mzn) as f:
@@ -493,13 +597,13 @@ def _minizinc_preliminaries(
                 mzn_dir, mzn_name = os.path.split(mzn_file)
                 output_prefix, _ = os.path.splitext(mzn_name)
             output_dir = mzn_dir
-        logger.info('Keeping files in directory: {}'.format(output_dir))
+        logger.info('Keeping files in directory: %s', output_dir)
 
     mzn_file = save_model(
         model, output_dir=output_dir, output_prefix=output_prefix
     )
 
-    dzn_files = list(dzn_files)
+    dzn_files = [_fspath(dzn_file) for dzn_file in dzn_files]
     data, data_file = _prepare_data(
         mzn_file, data, keep, declare_enums=declare_enums
     )
@@ -517,7 +621,7 @@ def _minizinc_preliminaries(
     else:
         _output_mode = output_mode
 
-    logger.info('Derived output_mode: {}'.format(_output_mode))
+    logger.info('Derived output_mode: %s', _output_mode)
 
     return mzn_file, dzn_files, data_file, data, keep, _output_mode, types
 
@@ -529,7 +633,8 @@ def minizinc(
     solver=None, timeout=None, two_pass=None, pre_passes=None,
     output_objective=False, non_unique=False, all_solutions=False,
     num_solutions=None, free_search=False, parallel=None, seed=None,
-    rebase_arrays=True, keep_solutions=True, return_enums=False, **kwargs
+    rebase_arrays=True, keep_solutions=True, return_enums=False, cache=False,
+    **kwargs
 ):
     """Implements the workflow for solving a CSP problem encoded with MiniZinc.
 
@@ -626,6 +731,13 @@ def minizinc(
     return_enums : bool
         Wheter to return enum types along with the variable assignments in the
         solutions. Only used if ``output_mode='dict'``. Default is ``False``.
+    cache : bool
+        Whether to reuse the solver output of a previous call with the same
+        (preprocessed) model, data and arguments, instead of executing the
+        solver again. Useful when the same problem is solved repeatedly, e.g.
+        in a loop or in a notebook. Only successful executions are reused.
+        Files included by the model are not taken into account. Default is
+        ``False``.
     **kwargs
         Additional arguments to pass to the solver, provided as additional
         keyword arguments to this function. Check the solver documentation for
@@ -638,8 +750,10 @@ def minizinc(
         containing the solutions found by the solver. The format of the solution
         depends on the specified ``output_mode``. If ``keep_solutions=False``,
         the returned object cannot be addressed as a list and can only be
-        iterated once. If ``output_mode='raw'``, the function returns the whole
-        solution stream as a single string.
+        iterated once. The object also carries the log and the statistics of
+        the solver; the log is kept whole, unless the parser of the solver
+        limits its length. If ``output_mode='raw'``, the function returns the
+        whole solution stream as a single string.
     """
 
     mzn_file, dzn_files, data_file, data, keep, _output_mode, types = \
@@ -664,38 +778,196 @@ def minizinc(
         non_unique=non_unique, all_solutions=all_solutions,
         num_solutions=num_solutions, free_search=free_search, parallel=parallel,
         seed=seed, allow_multiple_assignments=allow_multiple_assignments,
-        **solver_args
+        cache=cache, stream=(output_mode != 'raw' and not cache), **solver_args
     )
 
-    if not keep:
-        _cleanup([mzn_file, data_file])
-
     if output_mode == 'raw':
+        if not keep:
+            _cleanup([mzn_file, data_file])
         logger.info('Returning raw output from the solver.')
         return proc.stdout_data
 
-    logger.info('Creating solution parser with arguments: {}'.format({
-        'output_mode': output_mode, 'rebase_arrays': rebase_arrays,
-        'types': types, 'keep_solutions': keep_solutions,
-        'return_enums': return_enums
-    }))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Creating solution parser with arguments: %s', {
+            'output_mode': output_mode, 'rebase_arrays': rebase_arrays,
+            'types': types, 'keep_solutions': keep_solutions,
+            'return_enums': return_enums
+        })
 
     parser = SolutionParser(
         solver, output_mode=output_mode, rebase_arrays=rebase_arrays,
         types=types, keep_solutions=keep_solutions, return_enums=return_enums
     )
-    solns = parser.parse(proc)
-    return solns
+    # Solutions are parsed while the solver is still running, so the temporary
+    # files can be removed only once all the output has been read.
+    try:
+        return parser.parse(proc)
+    finally:
+        if not keep:
+            _cleanup([mzn_file, data_file])
 
 
-def _solve_args(
-    solver, timeout=None, two_pass=None, pre_passes=None,
-    output_objective=False, non_unique=False, all_solutions=False,
-    num_solutions=None, free_search=False, parallel=None, seed=None, **kwargs
+def _minizinc_job(job, **kwargs):
+    if isinstance(job, str):
+        return minizinc(job, **kwargs)
+    job = {**kwargs, **job}
+    dzn_files = job.pop('dzn_files', ())
+    return minizinc(job.pop('mzn'), *dzn_files, **job)
+
+
+class SolverPool:
+    """Pool of threads solving several problems concurrently with the
+    ``minizinc`` function.
+
+    Each problem is solved in a separate thread by calling ``minizinc``. Since
+    the actual solving happens in the ``minizinc`` subprocesses, the problems
+    are solved in parallel. The pool can be used as a context manager, which
+    shuts it down on exit.
+
+    Parameters
+    ----------
+    max_workers : int
+        The maximum number of problems solved at the same time. Default is
+        ``None``, i.e. the default of ``concurrent.futures.ThreadPoolExecutor``.
+        Note that the solvers may use multiple threads each (see the
+        ``parallel`` argument of the ``minizinc`` function).
+    **kwargs
+        Arguments for the ``minizinc`` function common to all the problems.
+        Values given to the single problems take precedence.
+
+    Examples
+    --------
+    ::
+
+        with pymzn.SolverPool(max_workers=4, solver=pymzn.gecode) as pool:
+            futures = [pool.submit('model.mzn', data={'n': n}) for n in ns]
+            for future in pool.as_completed(futures):
+                print(future.result())
+    """
+
+    def __init__(self, max_workers=None, **kwargs):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._kwargs = kwargs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, mzn, *dzn_files, **kwargs):
+        """Schedules the solving of a problem.
+
+        Parameters
+        ----------
+        mzn : str
+            The minizinc model, either the path to the ``.mzn`` file or its
+            content.
+        *dzn_files
+            A list of paths to dzn files to attach to the minizinc execution.
+        **kwargs
+            Additional arguments for the ``minizinc`` function.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future result of the ``minizinc`` function.
+        """
+        return self._executor.submit(
+            minizinc, mzn, *dzn_files, **{**self._kwargs, **kwargs}
+        )
+
+    def map(self, jobs):
+        """Schedules the solving of several problems.
+
+        Parameters
+        ----------
+        jobs : iterable
+            The problems to solve. Each item is either a model (the path to a
+            ``.mzn`` file or its content), or a dictionary of arguments for the
+            ``minizinc`` function, which must contain the model under the key
+            ``mzn`` and may contain a list of dzn files under the key
+            ``dzn_files``.
+
+        Returns
+        -------
+        iterator
+            The results of the ``minizinc`` function, in the same order as the
+            jobs. All the jobs are scheduled immediately, while the iterator
+            waits for each result when it is requested.
+        """
+        futures = [
+            self._executor.submit(_minizinc_job, job, **self._kwargs)
+            for job in jobs
+        ]
+        return (future.result() for future in futures)
+
+    def as_completed(self, futures, timeout=None):
+        """Iterates over the given futures as they complete.
+
+        Parameters
+        ----------
+        futures : iterable
+            Futures returned by the ``submit`` method.
+        timeout : float
+            The maximum number of seconds to wait. Default is ``None``, i.e. no
+            limit.
+
+        Returns
+        -------
+        iterator
+            The futures, in the order in which their problems are solved.
+        """
+        return as_completed(futures, timeout=timeout)
+
+    def shutdown(self, wait=True):
+        """Shuts down the pool, after waiting for the scheduled problems to be
+        solved if ``wait`` is ``True``.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+def minizinc_many(jobs, max_workers=None, **kwargs):
+    """Solves several problems concurrently with the ``minizinc`` function.
+
+    This is a shortcut for the ``map`` method of a ``SolverPool``.
+
+    Parameters
+    ----------
+    jobs : iterable
+        The problems to solve. Each item is either a model (the path to a
+        ``.mzn`` file or its content), or a dictionary of arguments for the
+        ``minizinc`` function, which must contain the model under the key
+        ``mzn`` and may contain a list of dzn files under the key
+        ``dzn_files``.
+    max_workers : int
+        The maximum number of problems solved at the same time. Default is
+        ``None``, i.e. the default of ``concurrent.futures.ThreadPoolExecutor``.
+    **kwargs
+        Arguments for the ``minizinc`` function common to all the jobs. Values
+        given in the jobs take precedence.
+
+    Returns
+    -------
+    list
+        The results of the ``minizinc`` function, in the same order as the
+        jobs.
+    """
+    with SolverPool(max_workers=max_workers, **kwargs) as pool:
+        return list(pool.map(jobs))
+
+
+@lru_cache(maxsize=128, typed=True)
+def _minizinc_args(
+    timeout=None, two_pass=None, pre_passes=None, output_objective=False,
+    non_unique=False
 ):
+    # Solver-independent options only depend on hashable values, so the
+    # resulting arguments are computed once per combination of options.
     args = []
     if timeout:
-        args += ['--time-limit', str(timeout * 1000)] # minizinc takes milliseconds
+        # minizinc takes an integer number of milliseconds
+        args += ['--time-limit', str(int(timeout * 1000))]
 
     if two_pass:
         if isinstance(two_pass, bool):
@@ -712,13 +984,25 @@ def _solve_args(
     if non_unique:
         args.append('--non-unique')
 
-    args += ['--solver', solver.solver_id]
-    args += solver.args(
-        all_solutions=all_solutions, num_solutions=num_solutions,
-        free_search=free_search, parallel=parallel, seed=seed, **kwargs
-    )
+    return tuple(args)
 
-    return args
+
+def _solve_args(
+    solver, timeout=None, two_pass=None, pre_passes=None,
+    output_objective=False, non_unique=False, all_solutions=False,
+    num_solutions=None, free_search=False, parallel=None, seed=None, **kwargs
+):
+    return [
+        *_minizinc_args(
+            timeout=timeout, two_pass=two_pass, pre_passes=pre_passes,
+            output_objective=output_objective, non_unique=non_unique
+        ),
+        '--solver', solver.solver_id,
+        *solver.args(
+            all_solutions=all_solutions, num_solutions=num_solutions,
+            free_search=free_search, parallel=parallel, seed=seed, **kwargs
+        )
+    ]
 
 
 def solve(
@@ -726,7 +1010,8 @@ def solve(
     globals_dir=None, allow_multiple_assignments=False, output_mode='item',
     timeout=None, two_pass=None, pre_passes=None, output_objective=False,
     non_unique=False, all_solutions=False, num_solutions=None,
-    free_search=False, parallel=None, seed=None, **kwargs
+    free_search=False, parallel=None, seed=None, cache=False, stream=False,
+    **kwargs
 ):
     """Flatten and solve a MiniZinc program.
 
@@ -735,7 +1020,8 @@ def solve(
     solver : Solver
         The ``Solver`` instance to use.
     mzn : str
-        The path to the minizinc model file.
+        The path to the minizinc model file. It can also be the path to an
+        already flattened ``.fzn`` file, or the content of a model.
     *dzn_files
         A list of paths to dzn files to attach to the minizinc execution,
         provided as positional arguments; by default no data file is attached.
@@ -788,6 +1074,18 @@ def solve(
         The number of parallel threads the solver can utilize for the solving.
     seed : int
         The random number generator seed to pass to the solver.
+    cache : bool
+        Whether to reuse the output of a previous identical execution. Two
+        executions are identical if they have the same command line arguments
+        and the model and data files have the same content. Only executions
+        where minizinc exits successfully are cached. Files included by the
+        model are not taken into account. Default is ``False``.
+    stream : bool
+        If ``True``, return as soon as the solver is started, without waiting
+        for it to finish. The output of the solver can then be consumed
+        incrementally through the ``readlines`` method of the returned object,
+        e.g. by a ``SolutionParser``. The cache is not used in this case.
+        Default is ``False``.
     **kwargs
         Additional arguments to pass to the solver, provided as additional
         keyword arguments to this function. Check the solver documentation for
@@ -813,15 +1111,36 @@ def solve(
 
     input = mzn if args[-1] == '-' else None
 
+    # The time limit is enforced by minizinc itself; the process is terminated
+    # only if it has not stopped after an additional grace period.
+    kill_timeout = timeout + _TIMEOUT_GRACE if timeout else None
+
+    if stream:
+        proc = _start_minizinc_proc(*args, input=input, timeout=kill_timeout)
+        logger.debug('Solving process started.')
+        return proc
+
+    if cache:
+        key = _solve_cache_key(args, mzn, dzn_files, input=input)
+        proc = _cached_solve(key)
+        if proc is not None:
+            logger.info('Returning cached solver output.')
+            return proc
+
     t0 = _time()
 
     try:
-        proc = _run_minizinc_proc(*args, input=input)
+        proc = _run_minizinc_proc(*args, input=input, timeout=kill_timeout)
     except RuntimeError as err:
-        raise MiniZincError(mzn_file, args) from err
+        raise MiniZincError(mzn, args) from err
 
     solve_time = _time() - t0
-    logger.info('Solving completed in {:>3.2f} sec'.format(solve_time))
+    logger.info('Solving completed in %3.2f sec', solve_time)
+
+    # Failed runs and runs killed at the time limit are not cached, so that
+    # they are attempted again on the next call.
+    if cache and proc.returncode == 0:
+        _cache_solve(key, proc)
 
     return proc
 
@@ -918,13 +1237,13 @@ def mzn2fzn(
     t0 = _time()
     _run_minizinc(*args)
     flattening_time = _time() - t0
-    logger.info('Flattening completed in {:>3.2f} sec'.format(flattening_time))
+    logger.info('Flattening completed in %3.2f sec', flattening_time)
 
     if not keep:
         with contextlib.suppress(FileNotFoundError):
             if data_file:
                 os.remove(data_file)
-                logger.info('Deleted file: {}'.format(data_file))
+                logger.info('Deleted file: %s', data_file)
 
     if output_base:
         mzn_base = output_base
@@ -937,9 +1256,9 @@ def mzn2fzn(
     ozn_file = ozn_file if os.path.isfile(ozn_file) else None
 
     if fzn_file:
-        logger.info('Generated file: {}'.format(fzn_file))
+        logger.info('Generated file: %s', fzn_file)
     if ozn_file:
-        logger.info('Generated file: {}'.format(ozn_file))
+        logger.info('Generated file: %s', ozn_file)
 
     return fzn_file, ozn_file
 
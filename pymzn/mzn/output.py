@@ -69,7 +69,12 @@ class Solutions:
         problem was unsatisfiable or other errors that might have occurred.
     log : str
         The log of the solver on standard output. Usually contains solver
-        statistics and other log messages.
+        statistics and other log messages. If the solver parser limits the
+        length of the log (see the ``log_maxlen`` option of
+        ``pymzn.Solver.Parser``), only the last lines are kept.
+    stats : dict
+        The statistics printed by the solver (with the ``-s`` flag), mapping
+        the name of each statistic to its value as a string.
     stderr : str
         The log of the MiniZinc executable on standard error. Usually contains
         log messages about the flattening process, statistics and error
@@ -83,6 +88,7 @@ class Solutions:
         self._n_solns = 0
         self.status = Status.INCOMPLETE
         self.log = None
+        self.stats = None
         self.stderr = None
 
     def _fetch(self):
@@ -249,17 +255,18 @@ class SolutionParser:
     def _collect(self, proc, solns):
         for soln in self._parse(proc):
             solns._queue.put(soln)
-        logger.info('Solutions parsed: {}'.format(solns._queue.qsize()))
+        logger.info('Solutions parsed: %s', solns._queue.qsize())
 
         solns.status = self.status
         if solns.status is Status.INCOMPLETE and solns._queue.qsize() == 0:
             if re.search('MiniZinc: evaluation error:', proc.stderr_data):
                 logger.info('Evaluation error detected.')
                 solns.status = Status.ERROR
-        logger.info('Final status: {}'.format(solns.status))
+        logger.info('Final status: %s', solns.status)
 
         solns.stderr = proc.stderr_data
         solns.log = self.solver_parser.log
+        solns.stats = self.solver_parser.stats
 
     def _parse(self, proc):
         parse_lines = self._parse_lines()
@@ -269,15 +276,24 @@ class SolutionParser:
             if soln is not None:
                 yield soln
 
+    def _solver_process_line(self):
+        # Parsers written against the generator interface are still supported,
+        # otherwise the lines are passed to process_line directly.
+        solver_parser = self.solver_parser
+        if type(solver_parser).parse_out is Solver.Parser.parse_out:
+            return solver_parser.process_line
+        solver_parse_out = solver_parser.parse_out()
+        solver_parse_out.send(None)
+        return solver_parse_out.send
+
     def _parse_lines(self):
-        solver_parse_out = self.solver_parser.parse_out()
+        process_line = self._solver_process_line()
         split_solns = self._split_solns()
-        solver_parse_out.send(None)
         split_solns.send(None)
 
         line = yield
         while True:
-            line = solver_parse_out.send(line)
+            line = process_line(line)
             soln = split_solns.send(line)
             if soln is not None:
                 if self.output_mode == 'dict':
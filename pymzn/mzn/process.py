@@ -3,12 +3,68 @@ This package provides utilities for running synchronous external processes.
 """
 
 import os
+import select
+import shutil
+import threading
 import subprocess
 
 from time import monotonic as _time
+from functools import lru_cache
 
 
-__all__ = ['run_process']
+__all__ = ['run_process', 'start_process']
+
+
+if os.name == 'nt':
+    _popen_kwargs = {'shell': True}
+else:
+    # File descriptors are not inheritable by default (PEP 446), so there is no
+    # need to close them in the child. Keeping close_fds=False and passing the
+    # full path of the executable lets subprocess use posix_spawn instead of
+    # fork + exec, which is much cheaper when the Python process is large.
+    _popen_kwargs = {'close_fds': False}
+
+
+# Seconds to wait for a terminated process to exit before killing it.
+_TERMINATE_TIMEOUT = 1
+
+
+@lru_cache(maxsize=32)
+def _which(cmd, path, cwd):
+    # The current directory is only part of the cache key: relative commands
+    # and PATH entries are resolved against it.
+    executable = shutil.which(cmd, path=path)
+    return os.path.abspath(executable) if executable else None
+
+
+def _resolve_executable(args):
+    if os.name != 'nt':
+        # The lookup is cached per value of PATH and current directory, so
+        # that changes to the environment are still honoured.
+        executable = _which(args[0], os.environ.get('PATH'), os.getcwd())
+        if executable:
+            return (executable,) + args[1:]
+    return args
+
+
+def _wait(proc, timeout):
+    # Popen.wait with a timeout polls the process with sleeps of up to 50 ms.
+    # Where available, block on a pidfd instead, which becomes readable as soon
+    # as the process exits.
+    if hasattr(os, 'pidfd_open') and proc.returncode is None:
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            # The process has already been reaped.
+            return proc.wait()
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            if not poller.poll(timeout * 1000):
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+        finally:
+            os.close(pidfd)
+    return proc.wait(timeout=timeout)
 
 
 class CompletedProcessWrapper:
@@ -41,7 +97,7 @@ class CompletedProcessWrapper:
         yield from self.stdout_data.splitlines()
 
 
-def run_process(*args, input=None):
+def run_process(*args, input=None, timeout=None):
     """Run an external process.
 
     Parameters
@@ -51,17 +107,143 @@ def run_process(*args, input=None):
         be the executable to call.
     input : str or bytes
         The input stream to supply to the extenal process.
+    timeout : float
+        Wall-clock time limit in seconds. When it expires, the process is
+        terminated (and killed if it does not exit shortly after) and the output
+        produced until then is returned. Default is ``None``, i.e. no limit.
 
     Return
     ------
         Object wrapping the executed process.
     """
-    shell = os.name == 'nt'
+    args = _resolve_executable(args)
     start_time = _time()
-    cp = subprocess.run(
-        args, input=input, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        shell=shell, bufsize=1, universal_newlines=True
-    )
+    with subprocess.Popen(
+        args, stdin=(None if input is None else subprocess.PIPE),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1,
+        universal_newlines=True, **_popen_kwargs
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(input, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.terminate()
+            try:
+                stdout, stderr = proc.communicate(timeout=_TERMINATE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                stdout, stderr = proc.communicate()
+        except:
+            proc.kill()
+            raise
     end_time = _time()
+    cp = subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
     return CompletedProcessWrapper(cp, start_time, end_time)
 
+
+class ProcessWrapper:
+
+    def __init__(self, proc, input=None, timeout=None):
+        self._proc = proc
+        self.start_time = _time()
+        self.end_time = None
+        self.stdout_data = None
+        self.stderr_data = None
+        self._communicator = threading.Thread(
+            target=self._communicate, args=(input,), daemon=True
+        )
+        self._communicator.start()
+        self._timer = None
+        if timeout:
+            self._timer = threading.Timer(timeout, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def __repr__(self):
+        return repr(self._proc)
+
+    @property
+    def args(self):
+        return self._proc.args
+
+    @property
+    def returncode(self):
+        return self._proc.returncode
+
+    def _communicate(self, input):
+        # Feeds the input and drains the standard error in the background, so
+        # that the process never blocks on a full pipe while the standard
+        # output is being consumed.
+        try:
+            if input is not None:
+                self._write_input(input)
+            self.stderr_data = self._proc.stderr.read()
+        finally:
+            self._proc.stderr.close()
+
+    def _write_input(self, input):
+        # The process may exit without reading its input, in which case both
+        # the write and the flush on close fail with a broken pipe.
+        try:
+            self._proc.stdin.write(input)
+        except BrokenPipeError:
+            pass
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    def _expire(self):
+        # Once the process exits its standard output reaches end of file, so
+        # readlines stops after the lines produced until then.
+        self._proc.terminate()
+        try:
+            _wait(self._proc, _TERMINATE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+    def readlines(self):
+        try:
+            for line in self._proc.stdout:
+                yield line.rstrip('\n')
+            self._proc.wait()
+            self._communicator.join()
+        except:
+            if self.returncode is None:
+                self._proc.kill()
+                self._proc.wait()
+            raise
+        finally:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._proc.stdout.close()
+            self.end_time = _time()
+
+
+def start_process(*args, input=None, timeout=None):
+    """Start an external process, whose output can be read as a stream.
+
+    Parameters
+    ----------
+    *args : list of str
+        The arguments to pass to the external process. The first argument should
+        be the executable to call.
+    input : str or bytes
+        The input stream to supply to the extenal process.
+    timeout : float
+        Wall-clock time limit in seconds. When it expires, the process is
+        terminated (and killed if it does not exit shortly after) and reading
+        its output stops at the lines produced until then. Default is ``None``,
+        i.e. no limit.
+
+    Return
+    ------
+        Object wrapping the running process. The lines of the standard output
+        are yielded by its ``readlines`` method as soon as they are produced.
+    """
+    args = _resolve_executable(args)
+    proc = subprocess.Popen(
+        args, stdin=(None if input is None else subprocess.PIPE),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1,
+        universal_newlines=True, **_popen_kwargs
+    )
+    return ProcessWrapper(proc, input=input, timeout=timeout)
@@ -74,6 +74,9 @@ It is then possible to run the ``minizinc`` function with the custom solver:
 
 import re
 
+from functools import lru_cache
+from collections import deque
+
 
 __all__ = [
     'Solver', 'Gecode', 'Chuffed', 'Optimathsat', 'Opturion', 'MIPSolver',
@@ -82,6 +85,39 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=128, typed=True)
+def _solver_args(all_solutions, num_solutions, free_search, parallel, seed):
+    args = []
+    if all_solutions:
+        args.append('-a')
+    if num_solutions is not None:
+        args += ['-n', str(num_solutions)]
+    if free_search:
+        args.append('-f')
+    if parallel is not None:
+        args += ['-p', str(parallel)]
+    if seed is not None:
+        args += ['-r', str(seed)]
+    return tuple(args)
+
+
+# Characters for which a flag must be quoted. Minizinc splits the fzn flags with
+# its own splitter, which only honours double quotes and backslash escapes.
+_fzn_flag_quote_p = re.compile(r'[\s"\'\\]')
+_fzn_flag_escape_p = re.compile(r'(["\\])')
+
+
+def _fzn_flag_quote(flag):
+    if flag and not _fzn_flag_quote_p.search(flag):
+        return flag
+    return '"{}"'.format(_fzn_flag_escape_p.sub(r'\\\1', flag))
+
+
+@lru_cache(maxsize=32)
+def _fzn_flags_arg(fzn_flags):
+    return ' '.join(_fzn_flag_quote(flag) for flag in fzn_flags)
+
+
 class Solver:
     """Abstract solver class.
 
@@ -90,6 +126,13 @@ class Solver:
     solver_id : str
         The identifier to use when launching the minizinc command.
     """
+
+    __slots__ = ('solver_id',)
+
+    # Arguments always passed to the solver, enabling statistics and verbose
+    # output.
+    _DEFAULT_ARGS = ('-s', '-v')
+
     def __init__(self, solver_id):
         self.solver_id = solver_id
 
@@ -116,52 +159,75 @@ class Solver:
         seed : int
             The random number generator seed to pass to the solver.
         """
-        args = ['-s', '-v']
-        if all_solutions:
-            args.append('-a')
-        if num_solutions is not None:
-            args += ['-n', str(num_solutions)]
-        if free_search:
-            args.append('-f')
-        if parallel is not None:
-            args += ['-p', str(parallel)]
-        if seed is not None:
-            args += ['-r', str(seed)]
-        return args
+        return [*self._DEFAULT_ARGS, *_solver_args(
+            all_solutions, num_solutions, free_search, parallel, seed
+        )]
 
     class Parser:
+        """Parser of the output stream of the solver.
+
+        Parameters
+        ----------
+        log_maxlen : int
+            The maximum number of log lines to keep, older lines are discarded
+            first. Solvers with a very verbose output can limit the memory used
+            by the log by returning a parser with this option from their
+            ``parser`` method. Default is ``None``, i.e. all the lines are kept.
+        """
 
-        _line_comm_p = re.compile('%.*')
+        __slots__ = ('_log', '_stats')
 
-        def __init__(self):
-            self._log = []
+        # Prefix of the statistics lines printed by minizinc with the -s flag.
+        _STAT_PREFIX = '%%%mzn-stat:'
+
+        def __init__(self, log_maxlen=None):
+            self._log = deque(maxlen=log_maxlen)
+            self._stats = {}
 
         @property
         def log(self):
             return '\n'.join(self._log)
 
+        @property
+        def stats(self):
+            return self._stats
+
+        def process_line(self, line):
+            """Process a line of the output stream of the solver.
+
+            This function receives in input the lines of the stdout of the
+            minizinc solver, one at a time, and returns the processed line.
+            This function should remove all the lines that are not part of the
+            solution stream by returning empty strings instead (which will be
+            ignored by the solution parser).  This function should also process
+            the lines following a non-standard dzn format, substituting them
+            with equivalent standard dzn format (see e.g. Optimathsat).
+            Statistics should also be extracted, depending on the format of the
+            solver, and then returned by the stats property.  Debug messages may
+            be logged through the pymzn logger.
+            """
+            if line.startswith('%'):
+                if line.startswith(self._STAT_PREFIX):
+                    key, _, value = line[len(self._STAT_PREFIX):].partition('=')
+                    self._stats[key.strip()] = value.strip()
+                self._log.append(line)
+                return ''
+            return line
+
         def parse_out(self):
             """Parse the output stream of the solver.
 
             This function is a generator that will receive in input the lines of
             the stdout of the minizinc solver via the send() function. For each
-            line in input there should be a line in output.  This function
-            should remove all the lines that are not part of the solution stream
-            by yielding empty strings instead (which will be ignored by the
-            solution parser).  This function should also process the lines
-            following a non-standard dzn format, substituting them with
-            equivalent standard dzn format (see e.g. Optimathsat).  Statistics
-            should also be extracted, depending on the format of the solver, and
-            then returned by the stats property.  Debug messages may be logged
-            through the pymzn logger.
+            line in input there should be a line in output. The default
+            implementation forwards each line to ``process_line``, which should
+            be overridden instead of this function. Parsers overriding this
+            function are still supported, but are slower since each line goes
+            through the generator.
             """
             line = yield
             while True:
-                if self._line_comm_p.match(line):
-                    self._log.append(line)
-                    line = yield ''
-                else:
-                    line = yield line
+                line = yield self.process_line(line)
 
     def parser(self):
         """This function should return a new instance of the solver parser."""
@@ -169,20 +235,43 @@ class Solver:
 
 
 class Gecode(Solver):
-    """Interface to the Gecode solver."""
+    """Interface to the Gecode solver.
+
+    Parameters
+    ----------
+    fzn_flags : str or list
+        Default flags to pass to the FlatZinc interpreter of Gecode. They are
+        used whenever the ``fzn_flags`` argument is not provided on solving.
+    """
 
-    def __init__(self, solver_id='gecode'):
+    __slots__ = ('_fzn_flags',)
+
+    def __init__(self, solver_id='gecode', fzn_flags=None):
         super().__init__(solver_id)
+        self._fzn_flags = self._normalize_fzn_flags(fzn_flags)
+
+    @staticmethod
+    def _normalize_fzn_flags(fzn_flags):
+        if not fzn_flags:
+            return None
+        # The flags are split again by minizinc, so the single flags are quoted
+        # in case they contain spaces or quotes.
+        if isinstance(fzn_flags, (list, tuple)):
+            return _fzn_flags_arg(tuple(fzn_flags))
+        if not isinstance(fzn_flags, str):
+            raise TypeError('Unrecognized type for fzn_flags argument.')
+        return fzn_flags
 
     def args(self, fzn_flags=None, **kwargs):
         args = super().args(**kwargs)
 
+        if fzn_flags is None:
+            fzn_flags = self._fzn_flags
+        else:
+            fzn_flags = self._normalize_fzn_flags(fzn_flags)
+
         if fzn_flags:
-            if isinstance(fzn_flags, str):
-                fzn_flags = [fzn_flags]
-            elif not isinstance(fzn_file, list):
-                raise TypeError('Unrecognized type for fzn_flags argument.')
-            args += ['--fzn-flags', ''.join(fzn_flags)]
+            args += ['--fzn-flags', fzn_flags]
 
         return args
 
@@ -190,6 +279,8 @@ class Gecode(Solver):
 class Chuffed(Solver):
     """Interface to the Chuffed solver."""
 
+    __slots__ = ()
+
     def __init__(self, solver_id='chuffed'):
         super().__init__(solver_id)
 
@@ -197,6 +288,10 @@ class Chuffed(Solver):
 class Optimathsat(Solver):
     """Interface to the Optimathsat solver."""
 
+    __slots__ = ()
+
+    _DEFAULT_ARGS = ('-input=fzn',)
+
     def __init__(self, solver_id='optimathsat'):
         super().__init__(solver_id)
 
@@ -204,25 +299,25 @@ class Optimathsat(Solver):
         self, all_solutions=False, num_solutions=None, free_search=False,
         parallel=None, seed=None, **kwargs
     ):
-        args = ['-input=fzn']
-        return args
+        return list(self._DEFAULT_ARGS)
 
     class Parser(Solver.Parser):
 
-        _rational_p = re.compile('(\d+)\/(\d+)')
+        __slots__ = ()
 
-        def parse_out(self):
-            line = yield
-            while True:
-                if self._line_comm_p.match(line):
-                    self._stats.append(line)
-                    line = yield ''
-                else:
-                    for m in self._rational_p.finditer(line):
-                        n, d = m.groups()
-                        val = float(n) / float(d)
-                        line = re.sub('{}/{}'.format(n, d), str(val), line)
-                    line = yield line
+        _rational_p = re.compile(r'(\d+)/(\d+)')
+
+        @staticmethod
+        def _rational_repl(match):
+            n, d = match.groups()
+            # True division of the integers is correctly rounded, converting
+            # them to floats first may lose precision on large values.
+            return repr(int(n) / int(d))
+
+        def process_line(self, line):
+            if line.startswith('%'):
+                return super().process_line(line)
+            return self._rational_p.sub(self._rational_repl, line)
 
     def parser(self):
         return Optimathsat.Parser()
@@ -231,6 +326,8 @@ class Optimathsat(Solver):
 class Opturion(Solver):
     """Interface to the Opturion CPX solver."""
 
+    __slots__ = ()
+
     def __init__(self, solver_id='opturion'):
         super().__init__(solver_id)
 
@@ -238,6 +335,8 @@ class Opturion(Solver):
 class MIPSolver(Solver):
     """Generic interface to MIP solvers."""
 
+    __slots__ = ()
+
 
 class Gurobi(MIPSolver):
     """Interface to the Gurobi solver.
@@ -248,37 +347,36 @@ class Gurobi(MIPSolver):
         The string containing the dll of your gurobi installation.
     """
 
+    __slots__ = ('_dll', '_dll_args')
+
     def __init__(self, solver_id='gurobi', dll=None):
         super().__init__(solver_id)
         self.dll = dll
 
-    def args(self, *args, **kwargs):
-        args = super().args(*args, **kwargs)
-        if self.dll is not None:
-            args += ['--dll', self.dll]
-        return args
+    @property
+    def dll(self):
+        return self._dll
+
+    @dll.setter
+    def dll(self, dll):
+        self._dll = dll
+        self._dll_args = () if dll is None else ('--gurobi-dll', dll)
 
     def args(
         self, all_solutions=False, num_solutions=None, free_search=False,
         parallel=None, seed=None, **kwargs
     ):
-        args = []
-        if all_solutions:
-            args.append('-a')
-        if num_solutions is not None:
-            args += ['-n', num_solutions]
-        if free_search:
-            args.append('-f')
-        if parallel is not None:
-            args += ['-p', parallel]
-        if self.dll is not None:
-            args += ['--gurobi-dll', self.dll]
-        return args
+        # Gurobi does not take the statistics flags nor the seed.
+        return [*_solver_args(
+            all_solutions, num_solutions, free_search, parallel, None
+        ), *self._dll_args]
 
 
 class CBC(MIPSolver):
     """Interface to the COIN-OR CBC solver."""
 
+    __slots__ = ()
+
     def __init__(self, solver_id='osicbc'):
         super().__init__(solver_id)
 
@@ -286,6 +384,8 @@ class CBC(MIPSolver):
 class OscarCBLS(Solver):
     """Interface to the Oscar/CBLS solver."""
 
+    __slots__ = ()
+
     def __init__(self, solver_id='oscar-cbls'):
         super().__init__(solver_id)
 
@@ -304,6 +404,8 @@ class ORTools(Solver):
         or provide the full path here.
     """
 
+    __slots__ = ()
+
     def __init__(self, solver_id='or-tools'):
         super().__init__(solver_id)
 
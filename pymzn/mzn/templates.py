@@ -75,9 +75,13 @@ This ensures that the template engine will look for imported tempates into the
 provided path as well.
 """
 
-from .. import val2dzn, logger
+from .. import config, val2dzn, logger
 
-from copy import deepcopy
+import os
+
+from itertools import chain
+from functools import lru_cache
+from collections import OrderedDict
 from collections.abc import Iterable
 
 
@@ -88,21 +92,11 @@ def discretize(value, factor=100):
     """Discretize the given value, pre-multiplying by the given factor"""
     if not isinstance(value, Iterable):
         return int(value * factor)
-    int_value = list(deepcopy(value))
-    for i in range(len(int_value)):
-        int_value[i] = int(int_value[i] * factor)
-    return int_value
-
-try:
-    from jinja2 import (
-        Environment, BaseLoader, PackageLoader, FileSystemLoader,
-        TemplateNotFound
-    )
-    _has_jinja = True
-except ImportError:
-    _has_jinja = False
+    return [int(v * factor) for v in value]
 
-if _has_jinja:
+
+def _multi_loader():
+    from jinja2 import BaseLoader, TemplateNotFound
 
     class MultiLoader(BaseLoader):
 
@@ -121,20 +115,78 @@ if _has_jinja:
             raise TemplateNotFound(template)
 
         def list_templates(self):
-            seen = set()
-            templates = []
-            for loader in self._loaders:
-                for tmpl in loader.list_templates():
-                    if tmpl not in seen:
-                        templates.append(tmpl)
-                        seen.add(tmpl)
-            return templates
+            # Removes the duplicates while keeping the order of the loaders.
+            return list(OrderedDict.fromkeys(chain.from_iterable(
+                loader.list_templates() for loader in self._loaders
+            )))
+
+    return MultiLoader()
+
+
+@lru_cache(maxsize=1)
+def _get_env():
+    # Jinja2 is imported only when templates are actually used, since the
+    # import is expensive and most models are plain MiniZinc.
+    try:
+        from jinja2 import Environment
+    except ImportError:
+        return None
+    env = Environment(
+        trim_blocks=True, lstrip_blocks=True, loader=_multi_loader()
+    )
+    env.filters['dzn'] = val2dzn
+    env.filters['int'] = discretize
+    return env
+
+
+_jcache_dir = None
+
+
+def _update_bytecode_cache(env):
+    # Keeps the bytecode cache of the environment in sync with the
+    # template_cache configuration property, which may change at any time.
+    global _jcache_dir
+    cache_dir = config.get('template_cache')
+    if cache_dir == _jcache_dir:
+        return
+    from jinja2 import FileSystemBytecodeCache
+    if cache_dir is True:
+        env.bytecode_cache = FileSystemBytecodeCache()
+    elif cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    else:
+        env.bytecode_cache = None
+    _jcache_dir = cache_dir
+
+
+@lru_cache(maxsize=128)
+def _compile(source):
+    # The same model is usually rendered many times with different arguments,
+    # so compiled templates are reused.
+    return _get_env().from_string(source)
+
+
+# Types of the arguments for which the renderings are cached; the repr of the
+# values is part of the key since e.g. True, 1 and 1.0 are equal but render
+# differently.
+_scalar_types = (str, int, float, bool, type(None))
+
+
+def _render_key(args):
+    if not args:
+        return frozenset()
+    if not all(type(value) in _scalar_types for value in args.values()):
+        return None
+    return frozenset(
+        (key, repr(value), value) for key, value in args.items()
+    )
 
 
-    _jload = MultiLoader()
-    _jenv = Environment(trim_blocks=True, lstrip_blocks=True, loader=_jload)
-    _jenv.filters['dzn'] = val2dzn
-    _jenv.filters['int'] = discretize
+@lru_cache(maxsize=64)
+def _render_cached(source, key):
+    return _compile(source).render({arg[0]: arg[2] for arg in key})
+
 
 _except_text = (
     '\nThe template engine is currently not available.\nTo use templates make '
@@ -143,25 +195,49 @@ _except_text = (
     'http://jinja.pocoo.org/docs/intro/#installation'
 )
 
+# Opening delimiters of the Jinja blocks, variables and comments.
+_jinja_tokens = ('{%', '{{', '{#')
+
 def from_string(source, args=None):
     """Renders a template string"""
-    if _has_jinja:
-        logger.info('Preprocessing model with arguments: {}'.format(args))
-        return _jenv.from_string(source).render(args or {})
+    if not any(token in source for token in _jinja_tokens):
+        # Plain models have nothing to render.
+        if args and _get_env() is None:
+            raise RuntimeError(_except_text)
+        return source
+    env = _get_env()
+    if env is not None:
+        logger.info('Preprocessing model with arguments: %s', args)
+        _update_bytecode_cache(env)
+        # Templates on the search paths are checked for changes only on
+        # demand, which saves a stat call per include on each rendering.
+        env.auto_reload = bool(config.get('template_reload'))
+        key = None if env.auto_reload else _render_key(args)
+        if key is not None:
+            # Iterative solving usually renders the same template with the
+            # same arguments many times, changing only the data.
+            return _render_cached(source, key)
+        return _compile(source).render(args or {})
     if args:
         raise RuntimeError(_except_text)
     return source
 
 def add_package(package_name, package_path='templates', encoding='utf-8'):
     """Adds the given package to the template search routine"""
-    if not _has_jinja:
+    env = _get_env()
+    if env is None:
         raise RuntimeError(_except_text)
-    _jload.add_loader(PackageLoader(package_name, package_path, encoding))
+    from jinja2 import PackageLoader
+    env.loader.add_loader(PackageLoader(package_name, package_path, encoding))
+    _render_cached.cache_clear()
 
 
 def add_path(searchpath, encoding='utf-8', followlinks=False):
     """Adds the given path to the template search routine"""
-    if not _has_jinja:
+    env = _get_env()
+    if env is None:
         raise RuntimeError(_except_text)
-    _jload.add_loader(FileSystemLoader(searchpath, encoding, followlinks))
+    from jinja2 import FileSystemLoader
+    env.loader.add_loader(FileSystemLoader(searchpath, encoding, followlinks))
+    _render_cached.cache_clear()
 
@@ -4,3 +4,7 @@ from . import test_parse
 from .test_parse import *
 from . import test_minizinc
 from .test_minizinc import *
+from . import test_solvers
+from .test_solvers import *
+from . import test_templates
+from .test_templates import *
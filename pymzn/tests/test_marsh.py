@@ -10,7 +10,7 @@ class MarshTest(unittest.TestCase):
     def test_dzn_value(self):
 
         def _unwrap(s):
-            return re.sub('\s+', ' ', s)
+            return re.sub(r'\s+', ' ', s)
 
         def _dzn_value(val):
             return _unwrap(pymzn.val2dzn(val))
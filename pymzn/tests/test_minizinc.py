@@ -1,11 +1,16 @@
 import re
 import os
+import sys
+import stat
 import unittest
 
 from textwrap import dedent
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 
-from pymzn import minizinc, mzn2fzn, gecode, cbc, MiniZincError
+from pymzn import (
+    config, minizinc, minizinc_many, mzn2fzn, solve, gecode, cbc,
+    MiniZincError, SolverPool
+)
 
 
 def _save_as_temp_file(content, suffix):
@@ -201,6 +206,18 @@ class MinizincTestCalls(unittest.TestCase):
     def test_model_data_file_cbc(self):
         self._test_model_data_file(cbc)
 
+    # test solving several problems concurrently
+    def test_minizinc_many(self):
+        jobs = [{'mzn': self.model, 'data': self.data}] * 3
+        outs = minizinc_many(jobs, solver=gecode)
+        self.assertEqual([list(out) for out in outs], [self.solution] * 3)
+
+    def test_solver_pool(self):
+        with SolverPool(max_workers=2, solver=gecode) as pool:
+            futures = [pool.submit(self.model, data=self.data) for _ in range(3)]
+            outs = [f.result() for f in pool.as_completed(futures)]
+        self.assertEqual([list(out) for out in outs], [self.solution] * 3)
+
 
 class MinizincTestAllSolutions(unittest.TestCase):
 
@@ -220,3 +237,43 @@ class MinizincTestAllSolutions(unittest.TestCase):
         out = minizinc(self.model, solver=gecode, all_solutions=True)
         self.assertEqual(len(out), 120)
 
+
+
+@unittest.skipIf(os.name == 'nt', 'requires an executable script')
+class SolveCacheTest(unittest.TestCase):
+
+    model = 'var 1..3: x;\nsolve satisfy;\n% solve cache test\n'
+
+    def _write_minizinc(self, returncode):
+        with open(self.minizinc, 'w') as f:
+            f.write(dedent('''\
+                #!{}
+                import sys
+                sys.stdin.read()
+                print('x = 1;')
+                print('----------')
+                sys.exit({})
+                ''').format(sys.executable, returncode))
+        os.chmod(self.minizinc, stat.S_IRWXU)
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.minizinc = os.path.join(self.tmp_dir.name, 'minizinc')
+        self._minizinc = config.minizinc
+        config.minizinc = self.minizinc
+
+    def tearDown(self):
+        config.minizinc = self._minizinc
+        self.tmp_dir.cleanup()
+
+    # failed runs must not be returned by later calls
+    def test_failed_run_not_cached(self):
+        self._write_minizinc(1)
+        proc = solve(gecode, self.model, cache=True)
+        self.assertEqual(proc.returncode, 1)
+        self._write_minizinc(0)
+        proc = solve(gecode, self.model, cache=True)
+        self.assertEqual(proc.returncode, 0)
+        self._write_minizinc(1)
+        cached = solve(gecode, self.model, cache=True)
+        self.assertIs(cached, proc)
@@ -0,0 +1,141 @@
+import unittest
+
+from pymzn import Gecode, Gurobi, Solver, gecode, optimathsat
+from pymzn.mzn.output import SolutionParser
+
+
+def _parse_out(solver, lines):
+    parser = solver.parser()
+    return [parser.process_line(line) for line in lines]
+
+
+class _Output:
+
+    stderr_data = ''
+
+    def __init__(self, lines):
+        self._lines = lines
+
+    def readlines(self):
+        yield from self._lines
+
+
+class SolverTest(unittest.TestCase):
+
+    def test_args(self):
+        args = gecode.args(all_solutions=True, num_solutions=3)
+        self.assertEqual(args[:5], ['-s', '-v', '-a', '-n', '3'])
+        args.append('--extra')
+        args = gecode.args(all_solutions=True, num_solutions=3)
+        self.assertNotIn('--extra', args)
+
+    def test_parse_comments(self):
+        parser = gecode.parser()
+        lines = ['% comment', 'x = 1;', '%% stat', '----------']
+        self.assertEqual(
+            [parser.process_line(line) for line in lines],
+            ['', 'x = 1;', '', '----------']
+        )
+        self.assertEqual(parser.log, '% comment\n%% stat')
+
+    def test_parse_stats(self):
+        parser = gecode.parser()
+        lines = ['%%%mzn-stat: nodes=12', '%%%mzn-stat: failures=3', 'x = 1;']
+        for line in lines:
+            parser.process_line(line)
+        self.assertEqual(parser.stats, {'nodes': '12', 'failures': '3'})
+
+    def test_solutions_stats(self):
+        output = _Output([
+            'x = 1;', '----------', '%%%mzn-stat: nodes=12', '=========='
+        ])
+        solns = SolutionParser(gecode).parse(output)
+        self.assertEqual(solns.stats, {'nodes': '12'})
+
+    def test_log_maxlen(self):
+        parser = Solver.Parser(log_maxlen=2)
+        for i in range(3):
+            parser.process_line('% {}'.format(i))
+        self.assertEqual(parser.log, '% 1\n% 2')
+        parser = gecode.parser()
+        for i in range(3):
+            parser.process_line('% {}'.format(i))
+        self.assertEqual(parser.log, '% 0\n% 1\n% 2')
+
+    def test_parse_out(self):
+        parse_out = gecode.parser().parse_out()
+        parse_out.send(None)
+        self.assertEqual(parse_out.send('% comment'), '')
+        self.assertEqual(parse_out.send('x = 1;'), 'x = 1;')
+
+    def test_legacy_parser(self):
+
+        class LegacySolver(Solver):
+
+            class Parser(Solver.Parser):
+                def parse_out(self):
+                    line = yield
+                    while True:
+                        line = yield line.replace('y', 'x')
+
+            def parser(self):
+                return LegacySolver.Parser()
+
+        solver = LegacySolver('legacy')
+        output = _Output(['y = 1;', '----------', '=========='])
+        solns = SolutionParser(solver).parse(output)
+        self.assertEqual(list(solns), [{'x': 1}])
+
+
+class GecodeTest(unittest.TestCase):
+
+    def test_fzn_flags(self):
+        args = gecode.args(fzn_flags=['-a', 'b c'])
+        self.assertEqual(args[-2:], ['--fzn-flags', '-a "b c"'])
+        args = gecode.args(fzn_flags=['--x=y', 'say "hi"', 'a\\b', ''])
+        self.assertEqual(args[-1], r'--x=y "say \"hi\"" "a\\b" ""')
+        args = gecode.args(fzn_flags='-a -b')
+        self.assertEqual(args[-2:], ['--fzn-flags', '-a -b'])
+        with self.assertRaises(TypeError):
+            gecode.args(fzn_flags=1)
+
+    def test_default_fzn_flags(self):
+        solver = Gecode(fzn_flags=['-a'])
+        self.assertEqual(solver.args()[-2:], ['--fzn-flags', '-a'])
+        self.assertEqual(
+            solver.args(fzn_flags='-b')[-2:], ['--fzn-flags', '-b']
+        )
+        self.assertNotIn('--fzn-flags', solver.args(fzn_flags=[]))
+
+
+class GurobiTest(unittest.TestCase):
+
+    def test_args(self):
+        gurobi = Gurobi(dll='gurobi90')
+        self.assertEqual(
+            gurobi.args(num_solutions=2, parallel=4),
+            ['-n', '2', '-p', '4', '--gurobi-dll', 'gurobi90']
+        )
+        gurobi.dll = None
+        self.assertEqual(gurobi.args(all_solutions=True, seed=1), ['-a'])
+
+
+class OptimathsatTest(unittest.TestCase):
+
+    def test_parse_rationals(self):
+        lines = ['x = 1/2;', 'y = [11/4, 1/4, 3];', 'z = 5;']
+        self.assertEqual(
+            _parse_out(optimathsat, lines),
+            ['x = 0.5;', 'y = [2.75, 0.25, 3];', 'z = 5;']
+        )
+
+    def test_parse_large_rationals(self):
+        lines = ['x = 9007199254740993/3;']
+        self.assertEqual(
+            _parse_out(optimathsat, lines), ['x = 3002399751580331.0;']
+        )
+
+    def test_parse_comments(self):
+        parser = optimathsat.parser()
+        self.assertEqual(parser.process_line('% 1/2'), '')
+        self.assertEqual(parser.log, '% 1/2')
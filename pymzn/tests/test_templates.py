@@ -0,0 +1,59 @@
+import os
+import unittest
+
+from tempfile import TemporaryDirectory
+
+from pymzn import config, templates
+from pymzn.mzn import templates as _templates
+
+
+class TemplatesTest(unittest.TestCase):
+
+    def test_from_string(self):
+        source = 'int: n = {{ n }};'
+        self.assertEqual(templates.from_string(source, {'n': 1}), 'int: n = 1;')
+        self.assertEqual(templates.from_string(source, {'n': 2}), 'int: n = 2;')
+
+    def test_cached_rendering(self):
+        source = 'bool: b = {{ b }};'
+        self.assertEqual(
+            templates.from_string(source, {'b': True}), 'bool: b = True;'
+        )
+        self.assertEqual(templates.from_string(source, {'b': 1}), 'bool: b = 1;')
+        self.assertEqual(
+            templates.from_string(source, {'b': [1, 2]}), 'bool: b = [1, 2];'
+        )
+
+    def test_plain_source(self):
+        source = 'int: n = 1;\n% {not a template}\n'
+        self.assertIs(templates.from_string(source, {'n': 2}), source)
+
+    def test_filters(self):
+        source = 'x = {{ x | int }}; y = {{ y | dzn }};'
+        self.assertEqual(
+            templates.from_string(source, {'x': [0.5, 1.25], 'y': {1, 2}}),
+            'x = [50, 125]; y = 1..2;'
+        )
+
+    def test_reload(self):
+        loaders = list(_templates._get_env().loader._loaders)
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'reload.pmzn')
+            with open(path, 'w') as f:
+                f.write('int: n = 1;')
+            templates.add_path(tmp_dir)
+            try:
+                source = '{% include "reload.pmzn" %}'
+                self.assertEqual(templates.from_string(source), 'int: n = 1;')
+                with open(path, 'w') as f:
+                    f.write('int: n = 2;')
+                os.utime(path, (0, 0))
+                self.assertEqual(templates.from_string(source), 'int: n = 1;')
+                config.template_reload = True
+                self.assertEqual(templates.from_string(source), 'int: n = 2;')
+            finally:
+                config.pop('template_reload', None)
+                # The search path is removed along with the directory.
+                _templates._get_env().loader._loaders[:] = loaders
+                _templates._get_env().cache.clear()
+                _templates._render_cached.cache_clear()